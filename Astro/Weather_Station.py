@@ -1,17 +1,39 @@
 #!/usr/bin/env python3
 """
 Ecowitt Weather Station to Wunderground Uploader
-Pulls data from local Ecowitt weather station and cloud coverage from OpenWeatherMap,
-then uploads combined data to Wunderground.
+Pulls data from local Ecowitt weather station (polled, or pushed by the gateway)
+and cloud coverage from OpenWeatherMap, then uploads combined data to Wunderground.
 """
 
+from __future__ import annotations
+
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+import hmac
 import logging
-from typing import Dict, Optional
-from datetime import datetime
+import socket
+import sqlite3
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qsl
+from datetime import datetime, timezone
 from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING
+
+# orjson decodes several times faster than the stdlib parser; fall back to
+# json where it isn't installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Only needed for annotations, which are not evaluated at runtime
+if TYPE_CHECKING:
+    from typing import Callable, Dict, List, Optional, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -21,7 +43,126 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class HostHeaderSSLAdapter(HTTPAdapter):
+    """
+    HTTPS adapter that verifies TLS against the Host header
+    
+    This lets a request go to a pre-resolved IP address while SNI and the
+    certificate check still use the real hostname.
+    """
+    
+    def send(self, request, **kwargs):
+        host = request.headers.get('Host')
+        pool_kwargs = self.poolmanager.connection_pool_kw
+        if host:
+            pool_kwargs['assert_hostname'] = host
+            pool_kwargs['server_hostname'] = host
+        else:
+            pool_kwargs.pop('assert_hostname', None)
+            pool_kwargs.pop('server_hostname', None)
+        return super().send(request, **kwargs)
+
+
+class CappedRetry(Retry):
+    """
+    Retry policy that honours Retry-After within limits
+    
+    A 429 is only retried when the server says how long to wait, and that
+    wait is capped so a long hint can't stall the update loop.
+    """
+    
+    max_retry_after = 30  # seconds
+    
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if status_code == 429 and not has_retry_after:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.max_retry_after)
+
+
+class ResolvedHost:
+    """Cache the IP address of a hostname to skip per-request DNS lookups"""
+    
+    def __init__(self, hostname: str, ttl: float = 3600):
+        """
+        Initialize the cached lookup
+        
+        Args:
+            hostname: Hostname to resolve
+            ttl: Seconds before the address is resolved again
+        """
+        self.hostname = hostname
+        self.ttl = ttl
+        self._address: Optional[str] = None
+        self._resolved_at = 0.0
+        
+    def address(self) -> str:
+        """
+        Get the cached IP address, resolving it when missing or stale
+        
+        Returns:
+            IP address, or the hostname itself if it has never resolved
+        """
+        now = time.monotonic()
+        if self._address is None or now - self._resolved_at >= self.ttl:
+            try:
+                self._address = socket.gethostbyname(self.hostname)
+                self._resolved_at = now
+            except OSError as e:
+                # Keep a stale address if there is one; try again next call
+                logger.warning(f"Could not resolve {self.hostname}: {e}")
+        return self._address or self.hostname
+    
+    def expire(self):
+        """Force the next address() call to resolve again"""
+        self._resolved_at = float('-inf')
+
+
+def create_session() -> requests.Session:
+    """
+    Build the HTTP session shared by all network clients
+    
+    Reusing one session keeps connections alive between requests, so each
+    cycle skips the TCP/TLS handshakes of a fresh connection.
+    
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    # Recover from transient failures within the cycle instead of losing
+    # the sample
+    retries = CappedRetry(
+        total=3,
+        connect=3,
+        read=2,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=('GET', 'POST')
+    )
+    session.mount('http://', HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=retries
+    ))
+    # HTTPS clients connect to cached IPs and name the server in Host
+    session.mount('https://', HostHeaderSSLAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=retries
+    ))
+    session.headers.update({
+        'User-Agent': 'WxUploader/1.0',
+        'Accept-Encoding': 'gzip'
+    })
+    return session
+
+
+@dataclass(slots=True, frozen=True)
 class WeatherData:
     """Container for combined weather data"""
     temperature: float
@@ -37,18 +178,36 @@ class WeatherData:
 class EcowittWeatherStation:
     """Retrieve data from local Ecowitt weather station"""
     
-    def __init__(self, gateway_ip: str, gateway_port: int = 8000):
+    # Adjust these mappings based on your station's output
+    # Common Ecowitt fields, as key paths into the gateway's JSON:
+    FIELD_PATHS = {
+        'temperature': ('outdoor', 'temperature'),
+        'humidity': ('outdoor', 'humidity'),
+        'pressure': ('pressure',),
+        'wind_speed': ('wind', 'windspeed'),
+        'wind_direction': ('wind', 'winddir'),
+        'rainfall': ('rain', 'rainevent'),
+    }
+    
+    def __init__(
+        self,
+        gateway_ip: str,
+        gateway_port: int = 8000,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize Ecowitt gateway connection
         
         Args:
             gateway_ip: IP address of Ecowitt gateway (e.g., "192.168.1.100")
             gateway_port: Port number (default 8000)
+            session: Shared HTTP session (a new one is created if omitted)
         """
+        self.session = session or create_session()
         self.gateway_ip = gateway_ip
         self.gateway_port = gateway_port
         self.base_url = f"http://{gateway_ip}:{gateway_port}"
-        self.timeout = 10
+        self.timeout = (3.05, 10)  # (connect, read) seconds
         
     def get_local_data(self) -> Optional[Dict]:
         """
@@ -58,17 +217,20 @@ class EcowittWeatherStation:
             Dictionary of weather data or None if request fails
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/get_stations",
                 timeout=self.timeout
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             logger.info("Successfully retrieved data from Ecowitt gateway")
             return data
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to retrieve data from Ecowitt: {e}")
             return None
+        except ValueError as e:
+            logger.error(f"Invalid JSON from Ecowitt: {e}")
+            return None
     
     def parse_data(self, raw_data: Dict) -> Optional[Dict]:
         """
@@ -81,16 +243,14 @@ class EcowittWeatherStation:
             Parsed weather data dictionary
         """
         try:
-            # Adjust these mappings based on your station's output
-            # Common Ecowitt fields:
-            parsed = {
-                'temperature': raw_data.get('outdoor', {}).get('temperature'),
-                'humidity': raw_data.get('outdoor', {}).get('humidity'),
-                'pressure': raw_data.get('pressure'),
-                'wind_speed': raw_data.get('wind', {}).get('windspeed'),
-                'wind_direction': raw_data.get('wind', {}).get('winddir'),
-                'rainfall': raw_data.get('rain', {}).get('rainevent'),
-            }
+            parsed = {}
+            for name, path in self.FIELD_PATHS.items():
+                value = raw_data
+                for key in path:
+                    value = value.get(key)
+                    if value is None:
+                        break
+                parsed[name] = value
             logger.debug(f"Parsed Ecowitt data: {parsed}")
             return parsed
         except Exception as e:
@@ -98,10 +258,166 @@ class EcowittWeatherStation:
             return None
 
 
+class EcowittPushReceiver:
+    """Receive data pushed by the Ecowitt gateway's Customized uploader"""
+    
+    # WeatherData field -> form field in the gateway's Ecowitt protocol POST
+    FIELDS = {
+        'temperature': 'tempf',
+        'humidity': 'humidity',
+        'pressure': 'baromrelin',
+        'wind_speed': 'windspeedmph',
+        'wind_direction': 'winddir',
+        'rainfall': 'eventrainin',
+    }
+    
+    # Largest form accepted; gateway posts are a few hundred bytes
+    MAX_BODY = 65536
+    
+    def __init__(
+        self,
+        on_data: Callable[[Dict], object],
+        passkey: str,
+        port: int = 8080,
+        path: str = "/data/report/",
+        host: str = ""
+    ):
+        """
+        Initialize the push receiver
+        
+        In the gateway's web UI (Weather Services -> Customized), choose the
+        Ecowitt protocol, this machine's IP, the same port and path, and an
+        upload interval.
+        
+        Args:
+            on_data: Called with the parsed data for every push
+            passkey: PASSKEY the gateway sends; posts without it are refused.
+                If empty, every post is refused and the PASSKEY it carried
+                is logged so it can be copied into the configuration.
+            port: TCP port to listen on (default 8080)
+            path: URL path the gateway posts to
+            host: Interface address to listen on ("" for all interfaces)
+        """
+        self.on_data = on_data
+        self.passkey = passkey
+        self.port = port
+        self.path = path
+        self.server = HTTPServer((host, port), self._make_handler())
+        
+    def _make_handler(self):
+        receiver = self
+        
+        class PushHandler(BaseHTTPRequestHandler):
+            # The server handles one connection at a time, so a client that
+            # stalls or a half-open socket must not block it for good
+            timeout = 10
+            
+            def do_POST(self):
+                try:
+                    length = int(self.headers.get('Content-Length', 0))
+                except ValueError:
+                    self.send_error(400, "Invalid Content-Length")
+                    return
+                if length < 0:
+                    self.send_error(400, "Invalid Content-Length")
+                    return
+                if length > receiver.MAX_BODY:
+                    self.send_error(413)
+                    return
+                try:
+                    body = self.rfile.read(length).decode('ascii', 'replace')
+                except OSError as e:
+                    logger.warning(
+                        f"Ecowitt push from {self.client_address[0]} "
+                        f"could not be read: {e}"
+                    )
+                    self.close_connection = True
+                    return
+                if self.path.rstrip('/') != receiver.path.rstrip('/'):
+                    self.send_error(404)
+                    return
+                
+                # Only the configured gateway may submit readings
+                form = dict(parse_qsl(body))
+                passkey = form.get('PASSKEY', '')
+                if not receiver.passkey:
+                    # Setup: nothing is accepted until a PASSKEY is configured
+                    logger.warning(
+                        f"Rejected Ecowitt push from {self.client_address[0]}: "
+                        f"no passkey configured; this push had PASSKEY {passkey!r}"
+                    )
+                    self.send_error(403)
+                    return
+                if not hmac.compare_digest(passkey.encode(), receiver.passkey.encode()):
+                    logger.warning(
+                        f"Rejected Ecowitt push from {self.client_address[0]} "
+                        f"with wrong PASSKEY"
+                    )
+                    self.send_error(403)
+                    return
+                
+                # Answer first so the gateway isn't held up by the upload
+                self.send_response(200)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                
+                parsed = receiver.parse_data(form)
+                if parsed:
+                    receiver.on_data(parsed)
+                    
+            def log_message(self, format, *args):
+                logger.debug(f"Ecowitt push: {format % args}")
+        
+        return PushHandler
+    
+    def parse_data(self, form: Dict[str, str]) -> Optional[Dict]:
+        """
+        Parse a pushed form into the same format as polled data
+        
+        Args:
+            form: Form fields posted by the gateway
+            
+        Returns:
+            Parsed weather data dictionary, or None if nothing usable
+        """
+        parsed = {}
+        for name, key in self.FIELDS.items():
+            try:
+                parsed[name] = float(form[key])
+            except (KeyError, ValueError):
+                parsed[name] = None
+        if parsed['wind_direction'] is not None:
+            parsed['wind_direction'] = int(parsed['wind_direction'])
+        if all(value is None for value in parsed.values()):
+            logger.error(f"Ecowitt push had no usable fields: {sorted(form)}")
+            return None
+        logger.info("Received data pushed by Ecowitt gateway")
+        logger.debug(f"Parsed Ecowitt data: {parsed}")
+        return parsed
+    
+    def serve_forever(self):
+        """Handle pushes until interrupted"""
+        logger.info(f"Listening for Ecowitt pushes on port {self.port}{self.path}")
+        self.server.serve_forever()
+        
+    def close(self):
+        """Stop listening"""
+        self.server.server_close()
+
+
 class CloudCoverageProvider:
     """Retrieve cloud coverage data from OpenWeatherMap"""
     
-    def __init__(self, api_key: str, latitude: float, longitude: float):
+    def __init__(
+        self,
+        api_key: str,
+        latitude: float,
+        longitude: float,
+        session: Optional[requests.Session] = None,
+        cache_ttl: float = 540,
+        failure_backoff: float = 120,
+        max_stale: float = 1800
+    ):
         """
         Initialize OpenWeatherMap API client
         
@@ -109,58 +425,133 @@ class CloudCoverageProvider:
             api_key: OpenWeatherMap API key (free tier available)
             latitude: Station latitude
             longitude: Station longitude
+            session: Shared HTTP session (a new one is created if omitted)
+            cache_ttl: Seconds to reuse the last cloud coverage value
+                (OWM only refreshes it about every 10 minutes)
+            failure_backoff: Seconds to wait after a failed lookup before
+                trying the API again (keep below the update interval)
+            max_stale: Oldest value, in seconds, that may stand in for a
+                failed lookup
         """
+        self.session = session or create_session()
         self.api_key = api_key
         self.latitude = latitude
         self.longitude = longitude
-        self.base_url = "https://api.openweathermap.org/data/2.5/weather"
-        self.timeout = 10
+        self.host = ResolvedHost("api.openweathermap.org")
+        self.path = "/data/2.5/weather"
+        # The 2.5 endpoint works with free keys but has no field selector,
+        # so the query is fixed and only clouds.all is read from the reply
+        self.params = {
+            'lat': latitude,
+            'lon': longitude,
+            'appid': api_key
+        }
+        self.timeout = (3.05, 10)  # (connect, read) seconds
+        self.cache_ttl = cache_ttl
+        self.failure_backoff = failure_backoff
+        self.max_stale = max_stale
+        self._cache_value: Optional[int] = None
+        self._cache_ts = 0.0
+        self._failure_ts = float('-inf')
         
     def get_cloud_coverage(self) -> Optional[int]:
         """
         Fetch cloud coverage percentage
         
+        A successful value is cached for cache_ttl seconds, so calls inside
+        that window are answered without hitting the API. After a failure
+        the API is left alone for failure_backoff seconds and the last known
+        value is returned instead, so an outage doesn't cost a full retry
+        sequence on every call.
+        
         Returns:
-            Cloud coverage as percentage (0-100) or None if request fails
+            Cloud coverage as percentage (0-100), or the last known value
+            when the API can't be reached (None if there is none or it is
+            older than max_stale)
         """
+        now = time.monotonic()
+        if self._cache_value is not None and now - self._cache_ts < self.cache_ttl:
+            logger.debug(f"Using cached cloud coverage: {self._cache_value}%")
+            return self._cache_value
+        if now - self._failure_ts < self.failure_backoff:
+            logger.debug("Cloud lookup failed recently, using last known value")
+            return self._last_known(now)
+        
         try:
-            params = {
-                'lat': self.latitude,
-                'lon': self.longitude,
-                'appid': self.api_key
-            }
-            response = requests.get(
-                self.base_url,
-                params=params,
+            response = self.session.get(
+                f"https://{self.host.address()}{self.path}",
+                params=self.params,
+                headers={'Host': self.host.hostname},
                 timeout=self.timeout
             )
             response.raise_for_status()
-            data = response.json()
-            cloud_coverage = data.get('clouds', {}).get('all', 0)
+            clouds = json_loads(response.content).get('clouds') or {}
+            cloud_coverage = clouds.get('all', 0)
             logger.info(f"Cloud coverage: {cloud_coverage}%")
+            self._cache_value = cloud_coverage
+            self._cache_ts = now
             return cloud_coverage
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to retrieve cloud data: {e}")
+            self.host.expire()
+        except ValueError as e:
+            logger.error(f"Invalid JSON from OpenWeatherMap: {e}")
+        
+        # Time the back-off from the end of the attempt, which may have
+        # spent a while in retries
+        self._failure_ts = time.monotonic()
+        last_known = self._last_known(self._failure_ts)
+        if last_known is not None:
+            logger.warning(f"Using last known cloud coverage: {last_known}%")
+        return last_known
+    
+    def _last_known(self, now: float) -> Optional[int]:
+        """Last fetched value, or None once it is older than max_stale"""
+        if now - self._cache_ts >= self.max_stale:
             return None
+        return self._cache_value
+
+
+class UploadResult(Enum):
+    """Outcome of a Wunderground upload"""
+    SUCCESS = "success"
+    RETRY = "retry"  # Transient failure (network, 5xx, 429); worth resending
+    REJECTED = "rejected"  # Refused by Wunderground; resending won't help
 
 
 class WundergroundUploader:
     """Upload weather data to Wunderground"""
     
-    def __init__(self, station_id: str, station_key: str):
+    def __init__(
+        self,
+        station_id: str,
+        station_key: str,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize Wunderground uploader
         
         Args:
             station_id: Your Wunderground station ID
             station_key: Your Wunderground station API key
+            session: Shared HTTP session (a new one is created if omitted)
         """
+        self.session = session or create_session()
         self.station_id = station_id
         self.station_key = station_key
-        self.upload_url = "https://weatherstation.wunderground.com/weatherstation/updateweatherstation.php"
-        self.timeout = 10
+        self.host = ResolvedHost("weatherstation.wunderground.com")
+        self.upload_path = "/weatherstation/updateweatherstation.php"
+        self.timeout = (3.05, 10)  # (connect, read) seconds
+        # Query parameters that are the same for every upload
+        self.base_params = {
+            'ID': station_id,
+            'PASSWORD': station_key,
+            'action': 'updateraw',
+            'realtime': 1,
+            'rtfreq': 2880  # Update frequency in seconds
+        }
         
-    def upload_data(self, weather_data: WeatherData) -> bool:
+    def upload_data(self, weather_data: WeatherData) -> UploadResult:
         """
         Upload combined weather data to Wunderground
         
@@ -168,43 +559,226 @@ class WundergroundUploader:
             weather_data: WeatherData object with all measurements
             
         Returns:
-            True if upload successful, False otherwise
+            UploadResult.SUCCESS, RETRY for transient failures, or REJECTED
+            when Wunderground refused the sample (4xx or a non-success reply)
         """
         try:
-            # Format data for Wunderground API
+            # Format data for Wunderground API (plain %-formatting avoids the
+            # locale-aware strftime path)
+            t = weather_data.timestamp
+            dateutc = '%04d-%02d-%02d %02d:%02d:%02d' % (
+                t.year, t.month, t.day, t.hour, t.minute, t.second
+            )
             params = {
-                'ID': self.station_id,
-                'PASSWORD': self.station_key,
-                'dateutc': weather_data.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+                **self.base_params,
+                'dateutc': dateutc,
                 'tempf': weather_data.temperature,
                 'humidity': weather_data.humidity,
                 'baromin': weather_data.pressure,
                 'windspeedmph': weather_data.wind_speed,
                 'winddir': weather_data.wind_direction,
                 'rainin': weather_data.rainfall,
-                'clouds': weather_data.cloud_coverage,
-                'action': 'updateraw',
-                'realtime': 1,
-                'rtfreq': 2880  # Update frequency in seconds
+                'clouds': weather_data.cloud_coverage
             }
             
-            response = requests.get(
-                self.upload_url,
+            response = self.session.get(
+                f"https://{self.host.address()}{self.upload_path}",
                 params=params,
+                headers={'Host': self.host.hostname},
                 timeout=self.timeout
             )
             response.raise_for_status()
             
-            if 'success' in response.text.lower():
+            # A good upload answers "success\n"; compare raw bytes so the
+            # body never goes through charset detection
+            body = response.content
+            if body[:7] == b'success':
                 logger.info("Successfully uploaded data to Wunderground")
-                return True
+                return UploadResult.SUCCESS
             else:
-                logger.warning(f"Wunderground response: {response.text}")
-                return False
+                # e.g. INVALIDPASSWORDID or a bad value in the sample
+                logger.warning(
+                    f"Wunderground rejected upload: {body[:128].decode('ascii', 'replace').strip()}"
+                )
+                return UploadResult.REJECTED
                 
+        except requests.exceptions.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if status is not None and 400 <= status < 500 and status != 429:
+                logger.error(f"Wunderground rejected upload: {e}")
+                return UploadResult.REJECTED
+            logger.error(f"Failed to upload to Wunderground: {e}")
+            return UploadResult.RETRY
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to upload to Wunderground: {e}")
-            return False
+            self.host.expire()
+            return UploadResult.RETRY
+
+
+class UploadBuffer:
+    """Persist failed uploads in SQLite so they can be sent later"""
+    
+    # Fixed-size record: timestamp, six measurements, cloud coverage and a
+    # bitmask of measurements that were missing (None)
+    RECORD = struct.Struct('<dffffffHH')
+    MEASUREMENTS = (
+        'temperature',
+        'humidity',
+        'pressure',
+        'wind_speed',
+        'wind_direction',
+        'rainfall',
+    )
+    
+    def __init__(self, db_path: str = "wx_buffer.db", max_rows: int = 2000):
+        """
+        Open (or create) the local upload buffer
+        
+        Args:
+            db_path: Path of the SQLite database file
+            max_rows: Most samples kept; the oldest are dropped beyond this
+        """
+        self.db_path = db_path
+        self.max_rows = max_rows
+        self.conn = sqlite3.connect(db_path, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS pending ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "ts REAL NOT NULL, "
+            "data BLOB NOT NULL)"
+        )
+        
+    def pack(self, weather_data: WeatherData) -> bytes:
+        """
+        Serialize a sample into a fixed-size binary record
+        
+        Args:
+            weather_data: WeatherData object to serialize
+            
+        Returns:
+            Packed record bytes
+        """
+        values = []
+        missing = 0
+        for bit, name in enumerate(self.MEASUREMENTS):
+            value = getattr(weather_data, name)
+            try:
+                values.append(float(value))
+            except (TypeError, ValueError):
+                values.append(0.0)
+                missing |= 1 << bit
+        return self.RECORD.pack(
+            weather_data.timestamp.timestamp(),
+            *values,
+            int(weather_data.cloud_coverage),
+            missing
+        )
+    
+    def unpack(self, record: bytes) -> WeatherData:
+        """
+        Rebuild a sample from a packed record
+        
+        Args:
+            record: Bytes produced by pack()
+            
+        Returns:
+            WeatherData object, with missing measurements set to None
+        """
+        ts, *values, cloud_coverage, missing = self.RECORD.unpack(record)
+        # Trim float32 round-off (70.1 unpacks as 70.0999984741211)
+        fields = {
+            name: None if missing & (1 << bit) else float('%.6g' % value)
+            for bit, (name, value) in enumerate(zip(self.MEASUREMENTS, values))
+        }
+        if fields['wind_direction'] is not None:
+            fields['wind_direction'] = int(fields['wind_direction'])
+        return WeatherData(
+            **fields,
+            cloud_coverage=cloud_coverage,
+            timestamp=datetime.fromtimestamp(ts, timezone.utc)
+        )
+        
+    def add(self, weather_data: WeatherData):
+        """
+        Queue a sample that could not be uploaded
+        
+        Args:
+            weather_data: WeatherData object to keep for a later upload
+        """
+        self.conn.execute(
+            "INSERT INTO pending (ts, data) VALUES (?, ?)",
+            (weather_data.timestamp.timestamp(), self.pack(weather_data))
+        )
+        # Bound storage during long outages by keeping only the newest rows
+        self.conn.execute(
+            "DELETE FROM pending WHERE id NOT IN "
+            "(SELECT id FROM pending ORDER BY ts DESC LIMIT ?)",
+            (self.max_rows,)
+        )
+        
+    def pending(self, limit: int = 20) -> List[Tuple[int, WeatherData]]:
+        """
+        Get the oldest queued samples
+        
+        Args:
+            limit: Maximum number of samples to return
+            
+        Returns:
+            List of (row id, WeatherData) tuples, oldest first
+        """
+        rows = self.conn.execute(
+            "SELECT id, data FROM pending ORDER BY ts LIMIT ?",
+            (limit,)
+        ).fetchall()
+        return [(row_id, self.unpack(data)) for row_id, data in rows]
+    
+    def drain(
+        self,
+        upload_fn: Callable[[WeatherData], UploadResult],
+        max_batch: int = 20
+    ) -> int:
+        """
+        Upload queued samples, oldest first, until one fails transiently
+        
+        The samples go out back to back, so with a keep-alive session they
+        all share one connection instead of a handshake per sample. Samples
+        Wunderground rejects are dropped so they can't block the queue.
+        
+        Args:
+            upload_fn: Uploads one sample and returns an UploadResult
+            max_batch: Maximum number of samples to send in one call
+            
+        Returns:
+            Number of samples uploaded and removed from the buffer
+        """
+        sent = 0
+        for row_id, weather_data in self.pending(max_batch):
+            result = upload_fn(weather_data)
+            if result is UploadResult.RETRY:
+                break
+            self.remove(row_id)
+            if result is UploadResult.REJECTED:
+                logger.warning(
+                    f"Dropped buffered sample rejected by Wunderground: "
+                    f"{weather_data}"
+                )
+            else:
+                sent += 1
+        return sent
+    
+    def remove(self, row_id: int):
+        """Delete a sample once it has been uploaded"""
+        self.conn.execute("DELETE FROM pending WHERE id = ?", (row_id,))
+        
+    def count(self) -> int:
+        """Number of samples waiting to be uploaded"""
+        return self.conn.execute("SELECT COUNT(*) FROM pending").fetchone()[0]
+    
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
 
 
 class WeatherStationManager:
@@ -217,7 +791,8 @@ class WeatherStationManager:
         station_latitude: float,
         station_longitude: float,
         wunderground_station_id: str,
-        wunderground_api_key: str
+        wunderground_api_key: str,
+        buffer_path: str = "wx_buffer.db"
     ):
         """
         Initialize the weather station manager
@@ -229,17 +804,31 @@ class WeatherStationManager:
             station_longitude: Station longitude for cloud data
             wunderground_station_id: Wunderground station ID
             wunderground_api_key: Wunderground API key
+            buffer_path: SQLite file holding uploads that failed
         """
-        self.ecowitt = EcowittWeatherStation(ecowitt_ip)
+        self.session = create_session()
+        self.ecowitt = EcowittWeatherStation(ecowitt_ip, session=self.session)
         self.cloud_provider = CloudCoverageProvider(
             owm_api_key,
             station_latitude,
-            station_longitude
+            station_longitude,
+            session=self.session
         )
         self.uploader = WundergroundUploader(
             wunderground_station_id,
-            wunderground_api_key
+            wunderground_api_key,
+            session=self.session
         )
+        # Ecowitt and OpenWeatherMap fetches are independent, so run them
+        # side by side instead of paying for both round-trips in sequence
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.buffer = UploadBuffer(buffer_path)
+        
+    def close(self):
+        """Release the worker threads, pooled connections and buffer"""
+        self.executor.shutdown(wait=False)
+        self.session.close()
+        self.buffer.close()
         
     def collect_and_upload(self) -> bool:
         """
@@ -248,8 +837,15 @@ class WeatherStationManager:
         Returns:
             True if upload successful, False otherwise
         """
-        # Get Ecowitt data
-        raw_data = self.ecowitt.get_local_data()
+        # Fetch Ecowitt data and cloud coverage concurrently
+        ecowitt_future = self.executor.submit(self.ecowitt.get_local_data)
+        cloud_future = self.executor.submit(
+            self.cloud_provider.get_cloud_coverage
+        )
+        raw_data = ecowitt_future.result()
+        cloud_coverage = cloud_future.result()
+        
+        # Check Ecowitt data
         if not raw_data:
             logger.error("Failed to get Ecowitt data")
             return False
@@ -259,8 +855,40 @@ class WeatherStationManager:
             logger.error("Failed to parse Ecowitt data")
             return False
         
-        # Get cloud coverage
+        return self.combine_and_upload(ecowitt_data, cloud_coverage)
+    
+    def handle_push(self, ecowitt_data: Dict) -> bool:
+        """
+        Upload data pushed by the Ecowitt gateway
+        
+        Cloud coverage comes from the provider's cache for most pushes, and
+        from its last known value while OpenWeatherMap is failing.
+        
+        Args:
+            ecowitt_data: Parsed data from EcowittPushReceiver
+            
+        Returns:
+            True if upload successful, False otherwise
+        """
         cloud_coverage = self.cloud_provider.get_cloud_coverage()
+        return self.combine_and_upload(ecowitt_data, cloud_coverage)
+    
+    def combine_and_upload(
+        self,
+        ecowitt_data: Dict,
+        cloud_coverage: Optional[int]
+    ) -> bool:
+        """
+        Merge station data with cloud coverage and upload to Wunderground
+        
+        Args:
+            ecowitt_data: Parsed Ecowitt data
+            cloud_coverage: Cloud coverage percentage, or None if unknown
+            
+        Returns:
+            True if upload successful, False otherwise
+        """
+        # Check cloud coverage
         if cloud_coverage is None:
             logger.warning("Could not get cloud coverage, using 0")
             cloud_coverage = 0
@@ -274,13 +902,39 @@ class WeatherStationManager:
             wind_direction=ecowitt_data.get('wind_direction', 0),
             rainfall=ecowitt_data.get('rainfall', 0),
             cloud_coverage=cloud_coverage,
-            timestamp=datetime.utcnow()
+            timestamp=datetime.now(timezone.utc)
         )
         
         logger.info(f"Combined weather data: {weather_data}")
         
-        # Upload to Wunderground
-        return self.uploader.upload_data(weather_data)
+        # Upload to Wunderground, keeping the sample if it may go through
+        # later; a rejected sample would only be rejected again
+        result = self.uploader.upload_data(weather_data)
+        if result is UploadResult.RETRY:
+            # A broken buffer (disk full, read-only card, locked database)
+            # costs this sample, not the whole uploader
+            try:
+                self.buffer.add(weather_data)
+                logger.warning(
+                    f"Buffered sample for later upload "
+                    f"({self.buffer.count()} pending)"
+                )
+            except (sqlite3.Error, struct.error) as e:
+                logger.error(f"Failed to buffer sample, dropping it: {e}")
+            return False
+        if result is UploadResult.REJECTED:
+            logger.warning("Dropped sample rejected by Wunderground")
+            return False
+        
+        # The link is up, so send anything left over from earlier failures
+        try:
+            sent = self.buffer.drain(self.uploader.upload_data)
+        except (sqlite3.Error, struct.error) as e:
+            logger.error(f"Failed to drain upload buffer: {e}")
+            return True
+        if sent:
+            logger.info(f"Uploaded {sent} buffered samples")
+        return True
 
 
 def main():
@@ -301,6 +955,17 @@ def main():
     
     # Update interval in seconds
     UPDATE_INTERVAL = 300  # 5 minutes
+    
+    # Set to a port (e.g. 8080) to have the gateway push data here via its
+    # Customized uploader instead of polling it every UPDATE_INTERVAL
+    ECOWITT_PUSH_PORT = None
+    ECOWITT_PUSH_HOST = ""  # Interface to listen on; "" for all
+    # PASSKEY field of the gateway's posts; until set, every push is
+    # rejected and the warning shows the PASSKEY that was received
+    ECOWITT_PASSKEY = ""
+    
+    # Local store for uploads that fail while offline
+    BUFFER_DB_PATH = "wx_buffer.db"
     # ======================================
     
     # Validate configuration
@@ -314,19 +979,53 @@ def main():
         station_latitude=STATION_LATITUDE,
         station_longitude=STATION_LONGITUDE,
         wunderground_station_id=WU_STATION_ID,
-        wunderground_api_key=WU_API_KEY
+        wunderground_api_key=WU_API_KEY,
+        buffer_path=BUFFER_DB_PATH
     )
     
     logger.info("Starting Weather Station uploader")
     
+    if ECOWITT_PUSH_PORT:
+        if not ECOWITT_PASSKEY:
+            logger.warning(
+                "ECOWITT_PASSKEY is not set; all pushes will be rejected and "
+                "their PASSKEY logged so it can be configured"
+            )
+        receiver = EcowittPushReceiver(
+            manager.handle_push,
+            passkey=ECOWITT_PASSKEY,
+            port=ECOWITT_PUSH_PORT,
+            host=ECOWITT_PUSH_HOST
+        )
+        try:
+            receiver.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Shutting down Weather Station uploader")
+        finally:
+            receiver.close()
+            manager.close()
+        return
+    
     try:
+        # Schedule each cycle at start + n * UPDATE_INTERVAL so the time
+        # spent collecting and uploading does not push later cycles back
+        next_run = time.monotonic()
         while True:
             logger.info("Collecting and uploading weather data...")
             manager.collect_and_upload()
-            logger.info(f"Waiting {UPDATE_INTERVAL} seconds until next update")
-            time.sleep(UPDATE_INTERVAL)
+            next_run += UPDATE_INTERVAL
+            delay = next_run - time.monotonic()
+            if delay > 0:
+                logger.info(f"Waiting {delay:.0f} seconds until next update")
+                time.sleep(delay)
+            else:
+                # Overran the interval; start now rather than catching up
+                logger.warning("Update cycle overran the interval, falling behind")
+                next_run = time.monotonic()
     except KeyboardInterrupt:
         logger.info("Shutting down Weather Station uploader")
+    finally:
+        manager.close()
 
 
 if __name__ == "__main__":
@@ -8,25 +8,41 @@ GPIO.setwarnings(False)
 # Define GPIO pin for LED
 LED_PIN = 5
 LED_PIN2 = 20
+LED_PINS = (LED_PIN, LED_PIN2)  # Driven together with one call
 
 # Set up the GPIO pins as outputs
-GPIO.setup(LED_PIN, GPIO.OUT)
-GPIO.setup(LED_PIN2, GPIO.OUT)
+GPIO.setup(LED_PINS, GPIO.OUT)
+
+# Blink timing
+HALF_PERIOD = 1.0  # Seconds on, then seconds off
+REPORT_EVERY = 10  # Print a status line every N blinks
+
+def sleep_until(deadline):
+    # Sleep until deadline and return it; if already past it (after a
+    # stall or heavy load), re-anchor on now instead of blinking in a burst
+    delay = deadline - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+        return deadline
+    return time.monotonic()
 
 try:
     print("Blinking LED on GPIO07. Press Ctrl+C to stop...")
+    blinks = 0
+    # Wake at fixed deadlines so GPIO and print time don't stretch the period
+    deadline = time.monotonic()
     while True:
         # Turn LED on
-        GPIO.output(LED_PIN, GPIO.HIGH)
-        GPIO.output(LED_PIN2, GPIO.HIGH)
-        print("LED ON")
-        time.sleep(1)  # Wait 1 second
+        GPIO.output(LED_PINS, GPIO.HIGH)
+        deadline = sleep_until(deadline + HALF_PERIOD)
         
         # Turn LED off
-        GPIO.output(LED_PIN, GPIO.LOW)
-        GPIO.output(LED_PIN2, GPIO.LOW)
-        print("LED OFF")
-        time.sleep(1)  # Wait 1 second
+        GPIO.output(LED_PINS, GPIO.LOW)
+        
+        blinks += 1
+        if blinks % REPORT_EVERY == 0:
+            print(f"LED blinked {blinks} times")
+        deadline = sleep_until(deadline + HALF_PERIOD)
 
 except KeyboardInterrupt:
     print("\nProgram stopped by user")
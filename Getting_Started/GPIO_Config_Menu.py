@@ -1,22 +1,31 @@
 import tkinter as tk
+from collections import defaultdict
 from tkinter import ttk, messagebox
 import RPi.GPIO as GPIO
 
+# Raspberry Pi GPIO pins (BCM numbering)
+GPIO_PINS = (2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27)
+
 class GPIOConfigMenu:
+    # (label, state) for each selectable pin mode
+    _MODES = (("Unused", "unused"), ("Input", "input"), ("Output", "output"))
+    _MODE_LABELS = tuple(label for label, _ in _MODES)
+    _MODE_STATES = dict(_MODES)
+    _PIN_LABELS = {pin: f"GPIO {pin}" for pin in GPIO_PINS}
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Raspberry Pi GPIO Configuration")
         self.root.geometry("500x600")
         
-        # Dictionary to store GPIO states
-        self.gpio_states = {}
-        
         # Raspberry Pi GPIO pins (BCM numbering)
-        self.gpio_pins = [2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27]
+        self.gpio_pins = GPIO_PINS
         
-        # Initialize GPIO states
-        for pin in self.gpio_pins:
-            self.gpio_states[pin] = tk.StringVar(value="unused")
+        # Dictionary to store GPIO states, all unused to start
+        self.gpio_states = dict.fromkeys(self.gpio_pins, "unused")
+        
+        # Mode picker currently shown over the pin table, if any
+        self.picker = None
         
         self.create_widgets()
     
@@ -25,28 +34,30 @@ class GPIOConfigMenu:
         title_label = ttk.Label(self.root, text="GPIO Pin Configuration", font=("Arial", 14, "bold"))
         title_label.pack(pady=10)
         
-        # Frame for canvas and scrollbar
+        # Frame for pin table and scrollbar
         frame = ttk.Frame(self.root)
         frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Canvas for scrollable content
-        canvas = tk.Canvas(frame, bg="white")
-        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+        # One row per GPIO pin; double-click a row to change its mode
+        self.tree = ttk.Treeview(frame, columns=("mode",), show="tree headings")
+        self.tree.heading("#0", text="Pin")
+        self.tree.heading("mode", text="Mode")
+        self.tree.column("#0", width=120)
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=self.tree.yview)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        def on_scroll(first, last):
+            # The picker is placed at fixed coordinates, so once the rows
+            # move it would sit over another pin's cell
+            self.close_picker()
+            scrollbar.set(first, last)
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        self.tree.configure(yscrollcommand=on_scroll)
         
-        # Create GPIO configuration rows
         for pin in self.gpio_pins:
-            self.create_gpio_row(scrollable_frame, pin)
+            self.tree.insert("", "end", iid=str(pin), text=self._PIN_LABELS[pin], values=(self._MODE_LABELS[0],))
+        self.tree.bind("<Double-1>", self.edit_mode)
         
-        canvas.pack(side="left", fill=tk.BOTH, expand=True)
+        self.tree.pack(side="left", fill=tk.BOTH, expand=True)
         scrollbar.pack(side="right", fill="y")
         
         # Button frame
@@ -65,53 +76,84 @@ class GPIOConfigMenu:
         exit_btn = ttk.Button(button_frame, text="Exit", command=self.root.quit)
         exit_btn.pack(side=tk.LEFT, padx=5)
     
-    def create_gpio_row(self, parent, pin):
-        # Create a frame for each GPIO pin
-        pin_frame = ttk.Frame(parent, relief=tk.SUNKEN, borderwidth=1)
-        pin_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        # Pin label
-        pin_label = ttk.Label(pin_frame, text=f"GPIO {pin}", width=10, font=("Arial", 10, "bold"))
-        pin_label.pack(side=tk.LEFT, padx=10, pady=5)
-        
-        # Radio buttons for selection
-        ttk.Radiobutton(pin_frame, text="Unused", variable=self.gpio_states[pin], value="unused").pack(side=tk.LEFT, padx=5)
-        ttk.Radiobutton(pin_frame, text="Input", variable=self.gpio_states[pin], value="input").pack(side=tk.LEFT, padx=5)
-        ttk.Radiobutton(pin_frame, text="Output", variable=self.gpio_states[pin], value="output").pack(side=tk.LEFT, padx=5)
+    def edit_mode(self, event):
+        # Show a mode picker over the mode cell of the clicked row
+        self.close_picker()
+        
+        row = self.tree.identify_row(event.y)
+        cell = self.tree.bbox(row, "mode") if row else None
+        if not cell:
+            return
+        x, y, width, height = cell
+        pin = int(row)
+        
+        picker = ttk.Combobox(self.tree, values=self._MODE_LABELS, state="readonly")
+        picker.set(self.tree.set(row, "mode"))
+        picker.place(x=x, y=y, width=width, height=height)
+        picker.focus_set()
+        self.picker = picker
+        
+        def close(_event=None):
+            self.close_picker()
+        
+        def commit(_event=None):
+            label = picker.get()
+            self.tree.set(row, "mode", label)
+            self.gpio_states[pin] = self._MODE_STATES[label]
+            close()
+        
+        def focus_out(_event=None):
+            # Opening the dropdown moves focus into the picker's own popdown
+            # list, so only close once focus has left the picker entirely
+            def check():
+                focus = str(self.root.tk.call("focus"))
+                if self.picker is picker and not focus.startswith(str(picker)):
+                    close()
+            self.root.after_idle(check)
+        
+        picker.bind("<<ComboboxSelected>>", commit)
+        picker.bind("<Return>", commit)
+        picker.bind("<Escape>", close)
+        picker.bind("<FocusOut>", focus_out)
+    
+    def close_picker(self):
+        # Remove the mode picker, if one is shown
+        if self.picker is not None:
+            self.picker.destroy()
+            self.picker = None
     
     def apply_config(self):
-        # Display current configuration
-        config_text = "GPIO Configuration:\n\n"
-        inputs = []
-        outputs = []
-        
-        for pin in self.gpio_pins:
-            state = self.gpio_states[pin].get()
-            if state == "input":
-                inputs.append(pin)
-            elif state == "output":
-                outputs.append(pin)
+        # Group pins by state in a single pass
+        pins_by_state = defaultdict(list)
+        for pin, state in self.gpio_states.items():
+            pins_by_state[state].append(pin)
+        inputs = pins_by_state["input"]
+        outputs = pins_by_state["output"]
         
+        # Display current configuration
+        lines = []
         if inputs:
-            config_text += f"Input Pins: {inputs}\n"
+            lines.append(f"Input Pins: {inputs}")
         if outputs:
-            config_text += f"Output Pins: {outputs}\n"
-        if not inputs and not outputs:
-            config_text += "No pins configured."
+            lines.append(f"Output Pins: {outputs}")
+        summary = "\n".join(lines)
         
-        messagebox.showinfo("Configuration Applied", config_text)
+        messagebox.showinfo(
+            "Configuration Applied",
+            f"GPIO Configuration:\n\n{summary or 'No pins configured.'}"
+        )
         
         # You can add actual GPIO setup code here
         print("Configuration Applied:")
-        if inputs:
-            print(f"Input Pins: {inputs}")
-        if outputs:
-            print(f"Output Pins: {outputs}")
+        if summary:
+            print(summary)
     
     def reset_config(self):
         # Reset all GPIO states to unused
+        self.close_picker()
         for pin in self.gpio_pins:
-            self.gpio_states[pin].set("unused")
+            self.gpio_states[pin] = "unused"
+            self.tree.set(str(pin), "mode", self._MODE_LABELS[0])
         messagebox.showinfo("Reset", "All GPIO pins reset to unused.")
 
 def main():